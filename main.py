@@ -6,18 +6,19 @@ Automates the transfer of production batch files from remote server to Google Dr
 
 import sys
 import json
+import time
 import argparse
 import logging
 from datetime import datetime
 from pathlib import Path
 
 from src.vpn_manager import VPNManager
-from src.drive_manager import DriveManager  
-from src.excel_reader import ExcelReader
+from src.drive_manager import DriveManager
 from src.file_processor import FileProcessor
 from src.logger import setup_logging
 from src.notifier import Notifier
 from src.config_manager import ConfigManager
+from src.workflow import execute_transfer_workflow
 
 
 def main():
@@ -34,6 +35,10 @@ def main():
     args = parser.parse_args()
     
     try:
+        # Monotonic clock for the duration log; datetime.now() stays for
+        # the human-readable start timestamp only
+        t0 = time.perf_counter_ns()
+
         # Setup logging
         logger = setup_logging(args.log_level)
         logger.info("=" * 60)
@@ -46,19 +51,27 @@ def main():
         config_manager = ConfigManager(args.config)
         config = config_manager.load_config()
         
+        # Import here so ExcelReader's pandas dependency is only paid once
+        # we know a transfer is actually running (keeps --help fast)
+        from src.excel_reader import ExcelReader
+
         # Initialize components
         vpn_manager = VPNManager(config['vpn_connection_name'])
         drive_manager = DriveManager()
-        excel_reader = ExcelReader(config['excel_file_path'])
+        excel_reader = ExcelReader(config['excel_file_path'], config['filter_criteria'])
         file_processor = FileProcessor(config, args.test_mode)
         notifier = Notifier(config.get('notifications', {}))
         
         # Execute workflow
         success = execute_transfer_workflow(
-            vpn_manager, drive_manager, excel_reader, 
-            file_processor, notifier, config, logger
+            vpn_manager, drive_manager, excel_reader,
+            file_processor, notifier, config, logger,
+            test_mode=args.test_mode
         )
         
+        duration_s = (time.perf_counter_ns() - t0) / 1e9
+        logger.info(f"Total duration: {duration_s:.2f} seconds")
+
         if success:
             logger.info("File transfer automation completed successfully")
             return 0
@@ -71,55 +84,5 @@ def main():
         return 1
 
 
-def execute_transfer_workflow(vpn_manager, drive_manager, excel_reader, 
-                            file_processor, notifier, config, logger):
-    """
-    Execute the complete file transfer workflow
-    
-    Returns:
-        bool: True if successful, False otherwise
-    """
-    try:
-        # Step 1: Verify VPN connection
-        logger.info("Step 1: Checking VPN connection...")
-        if not vpn_manager.verify_and_connect():
-            raise Exception("Failed to establish VPN connection")
-        
-        # Step 2: Verify drive access
-        logger.info("Step 2: Verifying drive access...")
-        if not drive_manager.verify_drives(config['remote_server_path'], 
-                                         config['local_gdrive_path']):
-            raise Exception("Failed to access required drives")
-        
-        # Step 3: Read and filter Excel data
-        logger.info("Step 3: Reading Excel file for batch status...")
-        batches_to_process = excel_reader.get_unreleased_batches(
-            config['filter_criteria']['initials_column'],
-            config['filter_criteria']['initials_value'],
-            config['filter_criteria']['release_status_column']
-        )
-        
-        if not batches_to_process:
-            logger.info("No unreleased batches found to process")
-            return True
-        
-        logger.info(f"Found {len(batches_to_process)} batches to process")
-        
-        # Step 4: Process each batch
-        logger.info("Step 4: Processing batches...")
-        transfer_results = file_processor.process_batches(batches_to_process)
-        
-        # Step 5: Send notifications
-        logger.info("Step 5: Sending notifications...")
-        notifier.send_completion_notification(transfer_results)
-        
-        return True
-        
-    except Exception as e:
-        logger.error(f"Workflow failed: {str(e)}")
-        notifier.send_error_notification(str(e))
-        return False
-
-
 if __name__ == "__main__":
     sys.exit(main())
\ No newline at end of file
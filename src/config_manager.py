@@ -1,38 +1,62 @@
 """Configuration management for the file transfer system"""
 
+import copy
+import functools
 import json
 import os
 from pathlib import Path
 from typing import Dict, Any
 
+try:
+    # orjson parses several times faster than the stdlib decoder; its
+    # JSONDecodeError subclasses json.JSONDecodeError, so error handling
+    # below works for either parser
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_config_file(config_path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Parse a JSON config file, cached on (path, mtime)
+
+    The mtime key makes edits to the file invalidate the cache entry, so
+    repeated load_config() calls in one process skip the disk read and
+    JSON parse entirely.
+    """
+    return _loads(Path(config_path).read_bytes())
+
 
 class ConfigManager:
     """Manages configuration loading and validation"""
-    
+
     def __init__(self, config_path: str):
         self.config_path = Path(config_path)
-    
+
     def load_config(self) -> Dict[str, Any]:
         """
         Load and validate configuration from JSON file
-        
+
         Returns:
             Dict[str, Any]: Configuration dictionary
-            
+
         Raises:
             FileNotFoundError: If config file doesn't exist
             ValueError: If config is invalid
         """
         if not self.config_path.exists():
             raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
-        
+
         try:
-            with open(self.config_path, 'r') as f:
-                config = json.load(f)
-            
+            mtime_ns = os.stat(self.config_path).st_mtime_ns
+            config = _parse_config_file(str(self.config_path), mtime_ns)
+
             self._validate_config(config)
-            return config
-            
+            # Deep copy so callers can mutate without poisoning the cache
+            return copy.deepcopy(config)
+
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in config file: {e}")
     
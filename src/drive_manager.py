@@ -1,16 +1,22 @@
 """Drive and network path management"""
 
 import os
+import time
+import asyncio
 import logging
-from pathlib import Path
-from typing import bool
+from typing import Dict, Tuple
 
 
 class DriveManager:
     """Manages drive mounting and accessibility verification"""
-    
+
+    # Drive state rarely changes mid-run, and each probe can stat a slow
+    # network share; cache results briefly to avoid redundant syscalls
+    ACCESS_CACHE_TTL = 5.0
+
     def __init__(self):
         self.logger = logging.getLogger(__name__)
+        self._access_cache: Dict[str, Tuple[float, bool]] = {}
     
     def verify_drives(self, remote_path: str, local_gdrive_path: str) -> bool:
         """
@@ -24,11 +30,16 @@ class DriveManager:
             bool: True if both drives accessible, False otherwise
         """
         try:
-            if not self.is_path_accessible(remote_path):
+            # Probe both drives at once; each stat may block for a while
+            # on a cold network mount
+            remote_ok, local_ok = asyncio.run(
+                self._probe_drives(remote_path, local_gdrive_path))
+
+            if not remote_ok:
                 self.logger.error(f"Remote drive not accessible: {remote_path}")
                 return False
-            
-            if not self.is_path_accessible(local_gdrive_path):
+
+            if not local_ok:
                 self.logger.warning(f"Local Google Drive path not found, creating: {local_gdrive_path}")
                 if not self.create_directory(local_gdrive_path):
                     return False
@@ -39,7 +50,14 @@ class DriveManager:
         except Exception as e:
             self.logger.error(f"Drive verification failed: {str(e)}")
             return False
-    
+
+    async def _probe_drives(self, remote_path: str, local_gdrive_path: str):
+        """Run both accessibility checks concurrently"""
+        return await asyncio.gather(
+            asyncio.to_thread(self.is_path_accessible, remote_path),
+            asyncio.to_thread(self.is_path_accessible, local_gdrive_path)
+        )
+
     def is_path_accessible(self, path: str) -> bool:
         """
         Check if a path is accessible
@@ -50,12 +68,27 @@ class DriveManager:
         Returns:
             bool: True if accessible, False otherwise
         """
+        cache_key = str(path)
+        cached = self._access_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < self.ACCESS_CACHE_TTL:
+            return cached[1]
+
         try:
-            path_obj = Path(path)
-            return path_obj.exists() and os.access(path, os.R_OK)
-        except Exception as e:
-            self.logger.debug(f"Path access check failed for {path}: {str(e)}")
-            return False
+            # stat proves existence but not readability (it can succeed
+            # on an entry the user cannot read), so keep the explicit
+            # R_OK check alongside it
+            os.stat(path)
+            accessible = os.access(path, os.R_OK)
+        except (FileNotFoundError, PermissionError):
+            accessible = False
+        except (OSError, ValueError) as e:
+            # %s-style args defer message formatting until a handler
+            # actually emits the record
+            self.logger.debug("Path access check failed for %s: %s", path, e)
+            accessible = False
+
+        self._access_cache[cache_key] = (time.monotonic(), accessible)
+        return accessible
     
     def create_directory(self, path: str) -> bool:
         """
@@ -68,7 +101,10 @@ class DriveManager:
             bool: True if created successfully, False otherwise
         """
         try:
-            Path(path).mkdir(parents=True, exist_ok=True)
+            # os.makedirs on the raw string; no Path object needed here
+            os.makedirs(path, exist_ok=True)
+            # The path just became accessible; drop any stale negative entry
+            self._access_cache.pop(str(path), None)
             self.logger.info(f"Created directory: {path}")
             return True
         except Exception as e:
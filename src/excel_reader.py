@@ -3,55 +3,147 @@
 import logging
 import pandas as pd
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+
+# Parsed workbooks cached on (path, mtime, size, columns); re-parsing the
+# Excel file dominates repeat get_unreleased_batches calls
+_DF_CACHE: Dict[tuple, Any] = {}
+_DF_CACHE_MAX = 4
 
 
 class ExcelReader:
     """Reads and filters Excel files for batch processing"""
-    
-    def __init__(self, excel_file_path: str):
+
+    # Candidate batch ID column headers, most likely first
+    ID_COLUMNS = ['Batch ID', 'BatchID', 'Batch_ID', 'ID', 'Batch Number']
+
+    def __init__(self, excel_file_path: str, filter_criteria: Optional[Dict[str, str]] = None):
         self.excel_file_path = Path(excel_file_path)
         self.logger = logging.getLogger(__name__)
-    
-    def get_unreleased_batches(self, initials_column: str, initials_value: str, 
-                              release_column: str) -> List[Dict[str, Any]]:
+        # A workbook uses one ID column throughout; remember the first
+        # match so later records skip the candidate scan
+        self._id_column_hint: Optional[str] = None
+        # Resolve the filter columns once at construction so repeated
+        # workflow runs skip the nested config lookups
+        self._filter = None
+        if filter_criteria:
+            self._filter = (
+                filter_criteria['initials_column'],
+                filter_criteria['initials_value'],
+                filter_criteria['release_status_column']
+            )
+
+    def get_unreleased_batches(self, initials_column: str = None, initials_value: str = None,
+                              release_column: str = None) -> List[Dict[str, Any]]:
         """
         Get list of unreleased batches for specified initials
-        
+
         Args:
-            initials_column: Column containing initials (e.g., 'AJ')
+            initials_column: Column containing initials (e.g., 'AJ');
+                defaults to the preset filter criteria
             initials_value: Initials to filter for (e.g., 'PP')
             release_column: Column indicating release status (e.g., 'AK')
-            
+
         Returns:
             List[Dict[str, Any]]: List of batch records to process
         """
+        if initials_column is None and self._filter:
+            initials_column, initials_value, release_column = self._filter
         try:
             if not self.excel_file_path.exists():
                 raise FileNotFoundError(f"Excel file not found: {self.excel_file_path}")
-            
+
             self.logger.info(f"Reading Excel file: {self.excel_file_path}")
-            df = pd.read_excel(self.excel_file_path, engine='pyxlsb')
-            
-            filtered_df = df[
-                (df[initials_column].astype(str).str.upper() == initials_value.upper()) &
-                (df[release_column].isna() | (df[release_column].astype(str).str.strip() == ''))
-            ]
-            
-            batches = filtered_df.to_dict('records')
-            
+            try:
+                # Stream rows straight from the workbook so the filter runs
+                # in a single pass without materializing a full DataFrame
+                batches = list(self._stream_unreleased(
+                    initials_column, initials_value, release_column))
+            except ImportError:
+                batches = self._read_and_filter_with_pandas(
+                    initials_column, initials_value, release_column)
+
             self.logger.info(f"Found {len(batches)} unreleased batches for initials '{initials_value}'")
             
             for batch in batches:
                 batch_id = batch.get('Batch ID', 'Unknown')
-                self.logger.debug(f"Batch to process: {batch_id}")
+                self.logger.debug("Batch to process: %s", batch_id)
             
             return batches
             
         except Exception as e:
             self.logger.error(f"Failed to read Excel file: {str(e)}")
             return []
-    
+
+    def _stream_unreleased(self, initials_column: str, initials_value: str,
+                           release_column: str):
+        """
+        Stream matching rows directly from the xlsb workbook
+
+        Iterates rows with pyxlsb and yields only records that match the
+        filter, so the full sheet is never held in memory.
+        """
+        from pyxlsb import open_workbook
+
+        needle = initials_value.upper()
+        with open_workbook(self.excel_file_path) as workbook:
+            with workbook.get_sheet(1) as sheet:
+                rows = sheet.rows()
+                header = [cell.v for cell in next(rows)]
+                initials_idx = header.index(initials_column)
+                release_idx = header.index(release_column)
+                needed = max(initials_idx, release_idx)
+
+                for row in rows:
+                    values = [cell.v for cell in row]
+                    if len(values) <= needed:
+                        continue
+                    if str(values[initials_idx]).upper() != needle:
+                        continue
+                    release = values[release_idx]
+                    if release is None or not str(release).strip():
+                        yield dict(zip(header, values))
+
+    def _read_and_filter_with_pandas(self, initials_column: str, initials_value: str,
+                                     release_column: str) -> List[Dict[str, Any]]:
+        """Fallback: load the workbook with pandas and filter in memory"""
+        import math
+        import numpy as np
+
+        # Only decode the columns the workflow actually consumes; Excel
+        # parsing cost is proportional to the cells materialized
+        needed_columns = set(self.ID_COLUMNS) | {initials_column, release_column}
+
+        stat = self.excel_file_path.stat()
+        cache_key = (str(self.excel_file_path), stat.st_mtime_ns, stat.st_size,
+                     frozenset(needed_columns))
+        df = _DF_CACHE.get(cache_key)
+        if df is None:
+            df = pd.read_excel(self.excel_file_path, engine='pyxlsb',
+                               usecols=lambda column: column in needed_columns)
+            if len(_DF_CACHE) >= _DF_CACHE_MAX:
+                _DF_CACHE.pop(next(iter(_DF_CACHE)))
+            _DF_CACHE[cache_key] = df
+
+        # One pass per column over the raw object arrays instead of
+        # chained astype/str accessors, which each rescan every row and
+        # allocate intermediate Series
+        needle = initials_value.upper()
+        initials = df[initials_column].to_numpy(dtype=object, copy=False)
+        release = df[release_column].to_numpy(dtype=object, copy=False)
+
+        mask = np.fromiter(
+            (str(value).upper() == needle for value in initials),
+            bool, len(initials))
+        mask &= np.fromiter(
+            (value is None
+             or (isinstance(value, float) and math.isnan(value))
+             or not str(value).strip()
+             for value in release),
+            bool, len(release))
+
+        return df[mask].to_dict('records')
+
     def get_batch_id_from_record(self, batch_record: Dict[str, Any]) -> str:
         """
         Extract batch ID from batch record
@@ -62,11 +154,14 @@ class ExcelReader:
         Returns:
             str: Batch ID or 'Unknown' if not found
         """
-        possible_id_columns = ['Batch ID', 'BatchID', 'Batch_ID', 'ID', 'Batch Number']
-        
-        for col in possible_id_columns:
+        hint = self._id_column_hint
+        if hint is not None and batch_record.get(hint):
+            return str(batch_record[hint]).strip()
+
+        for col in self.ID_COLUMNS:
             if col in batch_record and batch_record[col]:
+                self._id_column_hint = col
                 return str(batch_record[col]).strip()
-        
+
         self.logger.warning(f"Could not find batch ID in record: {list(batch_record.keys())}")
         return 'Unknown'
\ No newline at end of file
@@ -1,10 +1,26 @@
 """Centralized logging configuration"""
 
+import atexit
+import queue
 import logging
 import logging.handlers
 from pathlib import Path
 from datetime import datetime
 
+# Background listener that owns the actual console/file I/O
+_listener = None
+
+
+def _stop_listener():
+    """Flush and stop the queue listener (registered atexit)"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(_stop_listener)
+
 
 def setup_logging(log_level: str = 'INFO') -> logging.Logger:
     """
@@ -47,8 +63,18 @@ def setup_logging(log_level: str = 'INFO') -> logging.Logger:
     )
     file_handler.setFormatter(file_format)
     
-    # Add handlers
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
-    
+    # Route records through a queue: logging calls on the copy hot path
+    # become a lock-free enqueue, and the listener thread does the
+    # formatting and console/file writes
+    global _listener
+    _stop_listener()
+
+    log_queue = queue.Queue(-1)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    _listener = logging.handlers.QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    _listener.start()
+
     return logger
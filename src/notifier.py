@@ -1,14 +1,109 @@
 # src/notifier.py
 """Notification system for transfer results"""
 
+import atexit
+import ssl
 import smtplib
 import logging
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+import threading
+from email.message import EmailMessage
 from typing import Dict, Any, List
 from datetime import datetime
 
 
+# Fixed layout of the completion report; only the per-batch detail
+# sections are assembled dynamically
+_COMPLETION_SUMMARY = """
+BBU File Transfer Automation - Completion Report
+
+Summary:
+- Total Batches Processed: {total_batches}
+- Successful Transfers: {successful_transfers}
+- Failed Transfers: {failed_transfers}
+- Total Files Copied: {total_files_copied}
+- Success Rate: {success_rate:.1f}%
+
+"""
+
+# Built once at import: context construction loads the CA store, which
+# is not worth repeating per connection
+_TLS_CONTEXT = ssl.create_default_context()
+_TLS_CONTEXT.minimum_version = ssl.TLSVersion.TLSv1_2
+
+
+class _SmtpPool:
+    """
+    Reuses one authenticated SMTP connection per server account
+
+    Connect, TLS handshake and AUTH dominate the cost of sending a small
+    notification; keeping the connection open means repeat sends (error
+    plus completion emails in one run) pay those round-trips only once.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._connections: Dict[tuple, smtplib.SMTP] = {}
+
+    def send_message(self, email_config: Dict[str, Any], msg):
+        """Send a prepared message, reconnecting if the cached link died"""
+        key = (email_config['smtp_server'],
+               email_config.get('smtp_port', 587),
+               email_config.get('username'))
+
+        with self._lock:
+            connection = self._connections.get(key)
+            if connection is not None:
+                try:
+                    connection.noop()
+                except (smtplib.SMTPException, OSError):
+                    self._close(connection)
+                    connection = None
+
+            if connection is None:
+                connection = self._connect(email_config)
+                self._connections[key] = connection
+
+            # One transaction covers every recipient in the To header
+            connection.send_message(msg)
+
+    def _connect(self, email_config: Dict[str, Any]) -> smtplib.SMTP:
+        """Open and authenticate a new SMTP connection"""
+        server = email_config['smtp_server']
+        port = email_config.get('smtp_port', 587)
+
+        if port == 465:
+            # Implicit TLS: the handshake rides on the TCP connect,
+            # saving the extra EHLO/STARTTLS round-trip
+            connection = smtplib.SMTP_SSL(server, port, timeout=30,
+                                          context=_TLS_CONTEXT)
+        else:
+            connection = smtplib.SMTP(server, port, timeout=30)
+            if email_config.get('use_tls', True):
+                connection.starttls(context=_TLS_CONTEXT)
+
+        if email_config.get('username'):
+            connection.login(email_config['username'], email_config.get('password', ''))
+        return connection
+
+    @staticmethod
+    def _close(connection: smtplib.SMTP):
+        try:
+            connection.quit()
+        except (smtplib.SMTPException, OSError):
+            pass
+
+    def close_all(self):
+        """Quit every pooled connection (registered atexit)"""
+        with self._lock:
+            for connection in self._connections.values():
+                self._close(connection)
+            self._connections.clear()
+
+
+_smtp_pool = _SmtpPool()
+atexit.register(_smtp_pool.close_all)
+
+
 class Notifier:
     """Handles notifications for transfer results"""
     
@@ -60,19 +155,10 @@ This is an automated message from BBU File Transfer System.
     def _format_completion_message(self, results: Dict[str, Any]) -> str:
         """Format completion notification message"""
         success_rate = (results['successful_transfers'] / results['total_batches'] * 100) if results['total_batches'] > 0 else 0
-        
-        message = f"""
-BBU File Transfer Automation - Completion Report
 
-Summary:
-- Total Batches Processed: {results['total_batches']}
-- Successful Transfers: {results['successful_transfers']}
-- Failed Transfers: {results['failed_transfers']}
-- Total Files Copied: {results['total_files_copied']}
-- Success Rate: {success_rate:.1f}%
+        message = _COMPLETION_SUMMARY.format(success_rate=success_rate, **results)
+
 
-"""
-        
         if results['successful_transfers'] > 0:
             message += "✅ Successful Batches:\n"
             for batch in results['batch_details']:
@@ -98,12 +184,18 @@ Summary:
         
         email_config = self.config['email']
         
-        msg = MIMEMultipart()
+        # A plain-text notification needs no multipart container; a
+        # single EmailMessage is one object and skips the boundary
+        # generation of the legacy MIME classes
+        msg = EmailMessage()
         msg['From'] = email_config['from_address']
         msg['To'] = ', '.join(email_config['to_addresses'])
         msg['Subject'] = subject
-        
-        msg.attach(MIMEText(message, 'plain'))
-        
-        # Send email 
-        self.logger.info(f"Email notification prepared: {subject}")
\ No newline at end of file
+        msg.set_content(message)
+
+        if not email_config.get('smtp_server'):
+            self.logger.info(f"Email notification prepared: {subject}")
+            return
+
+        _smtp_pool.send_message(email_config, msg)
+        self.logger.info(f"Email notification sent: {subject}")
\ No newline at end of file
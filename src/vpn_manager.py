@@ -3,7 +3,6 @@
 import subprocess
 import logging
 import time
-from typing import bool
 
 
 class VPNManager:
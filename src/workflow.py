@@ -0,0 +1,93 @@
+"""Shared transfer workflow used by the CLI entrypoint"""
+
+import atexit
+import asyncio
+import threading
+
+
+async def _verify_connectivity(vpn_manager, drive_manager, config):
+    """
+    Verify the VPN and drives, overlapping only the independent checks
+
+    The local GDrive probe can run while the VPN connects, but the
+    remote share rides the tunnel and is only reachable once the VPN is
+    up - probing it earlier would cache a false negative while rasdial
+    is still dialing. It is therefore verified after vpn_ok.
+    """
+    vpn_ok, _ = await asyncio.gather(
+        asyncio.to_thread(vpn_manager.verify_and_connect),
+        asyncio.to_thread(drive_manager.is_path_accessible,
+                          config['local_gdrive_path'])
+    )
+    if not vpn_ok:
+        return False, False
+
+    drives_ok = await asyncio.to_thread(drive_manager.verify_drives,
+                                        config['remote_server_path'],
+                                        config['local_gdrive_path'])
+    return vpn_ok, drives_ok
+
+
+def execute_transfer_workflow(vpn_manager, drive_manager, excel_reader,
+                              file_processor, notifier, config, logger,
+                              test_mode=False):
+    """
+    Execute the complete file transfer workflow
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    try:
+        # Steps 1+2: Verify VPN connection and drive access. Outside
+        # test mode the local-drive probe overlaps the VPN handshake;
+        # the remote share is checked once the VPN is confirmed
+        logger.info("Step 1: Checking VPN connection...")
+        logger.info("Step 2: Verifying drive access...")
+        if test_mode:
+            vpn_ok = vpn_manager.verify_and_connect()
+            drives_ok = drive_manager.verify_drives(config['remote_server_path'],
+                                                    config['local_gdrive_path'])
+        else:
+            vpn_ok, drives_ok = asyncio.run(
+                _verify_connectivity(vpn_manager, drive_manager, config))
+
+        if not vpn_ok:
+            raise Exception("Failed to establish VPN connection")
+
+        if not drives_ok:
+            raise Exception("Failed to access required drives")
+
+        # Step 3: Read and filter Excel data
+        logger.info("Step 3: Reading Excel file for batch status...")
+        batches_to_process = excel_reader.get_unreleased_batches()
+
+        if not batches_to_process:
+            logger.info("No unreleased batches found to process")
+            return True
+
+        logger.info(f"Found {len(batches_to_process)} batches to process")
+
+        # Step 4: Process each batch
+        logger.info("Step 4: Processing batches...")
+        transfer_results = file_processor.process_batches(batches_to_process)
+
+        # Step 5: Send notifications in the background - the transfers
+        # are done, so the SMTP round-trips need not hold up the exit
+        # status. The atexit join gives the send time to finish before
+        # interpreter teardown.
+        logger.info("Step 5: Sending notifications...")
+        if test_mode:
+            notifier.send_completion_notification(transfer_results)
+        else:
+            sender = threading.Thread(
+                target=notifier.send_completion_notification,
+                args=(transfer_results,), daemon=True)
+            sender.start()
+            atexit.register(sender.join, 30)
+
+        return True
+
+    except Exception as e:
+        logger.error(f"Workflow failed: {str(e)}")
+        notifier.send_error_notification(str(e))
+        return False